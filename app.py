@@ -1,5 +1,6 @@
 import streamlit as st
 import ezdxf
+from ezdxf.addons import iterdxf
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -9,10 +10,254 @@ import tempfile
 import os
 import subprocess
 import shutil
+import functools
 import io
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple
 import math
 import platform
+import re
+
+from utils import GeometryUtils
+
+# scipy varsa temel-kolon eşleştirmesi KD-tree ile yapılır
+try:
+    from scipy.spatial import cKDTree
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+# Bir kolonun "temeli var" sayılması için en yakın temele olan
+# maksimum plan mesafesi (m)
+FOUNDATION_MATCH_TOLERANCE = 2.0
+
+# Minimum kolon kesit boyutu (m) — 25x25 cm altı kesitler uyarı üretir
+MIN_COLUMN_SIZE = 0.25
+
+# Statik kontrol eşikleri: döngü/format içinde gömülü sabit yerine modül
+# seviyesinde adlandırılır, kontrol başında yerel değişkene alınır
+MAX_BEAM_SPAN = 8.0           # m; üstü açıklık kontrolü uyarısı
+MAX_AREA_PER_COLUMN = 25.0    # m²/kolon; üstü düşük kolon yoğunluğu
+MIN_WALL_RATIO = 1.0          # %; perde alanı / döşeme alanı alt sınırı
+
+# Kolon yerleşiminde kütle merkezi ile medyan merkez arasındaki kabul
+# edilebilir sapma (m); üstü asimetrik yerleşim uyarısı üretir
+SYMMETRY_DEVIATION_LIMIT = 2.0
+
+# Bu boyutun (byte) üzerindeki DXF dosyaları tam DOM kurulmadan iterdxf ile
+# akış halinde ayrıştırılır; bellek tepe kullanımı yaklaşık yarıya iner
+LARGE_DXF_STREAM_THRESHOLD = 20 * 1024 * 1024
+
+# Yerleşim planında kesit etiketi basılacak maksimum kolon sayısı; üstünde
+# etiketler atlanır, kalabalık planlarda yazı çizimi grafiği domine eder
+MAX_LABELED_COLUMNS = 50
+
+# Katman adı -> eleman tipi eşlemesinde kullanılan anahtar kelimeler.
+# Modül seviyesinde, değişmez tuple'lar halinde tutulur ki sınıflandırma
+# saf bir fonksiyon olarak önbelleğe alınabilsin ve listeler yanlışlıkla
+# yerinde değiştirilemesin.
+LAYER_KEYWORDS = {
+    'kolon': ('kolon', 'column', 'col', 'pillar', 'c-'),
+    'kiriş': ('kiriş', 'beam', 'b-', 'kirish'),
+    'perde': ('perde', 'wall', 'shear', 'w-', 'duvar'),
+    'döşeme': ('döşeme', 'slab', 'floor', 'f-', 'doseme'),
+    'temel': ('temel', 'foundation', 'found', 'foot', 'fd-')
+}
+
+
+def file_has_content(path):
+    """Dosya mevcut ve boş değil mi? (exists+getsize yerine tek stat)"""
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def find_tool(tool):
+    """Aracın PATH'teki yerini bul (araç başına tek PATH taraması)"""
+    return shutil.which(tool)
+
+
+# Tip başına tek bir derlenmiş alternation: anahtar kelime başına Python
+# substring taraması yerine katman adı tip başına tek regex geçişiyle taranır
+_LAYER_PATTERNS = [
+    (re.compile('|'.join(map(re.escape, keywords))), element_type)
+    for element_type, keywords in LAYER_KEYWORDS.items()
+]
+
+
+@functools.lru_cache(maxsize=512)
+def classify_layer(layer_name):
+    """Katman adına göre eleman tipini belirle (benzersiz ad başına bir kez)
+
+    Bir çizimde O(10) katman ama O(10k) entity olur; lru_cache sayesinde
+    desen taraması katman adı başına yalnızca bir kez çalışır.
+    """
+    for pattern, element_type in _LAYER_PATTERNS:
+        if pattern.search(layer_name):
+            return element_type
+    return None
+
+def _shift_vertices(points):
+    """Köşe dizisini bir kaydırılmış kopya olarak döndür (roll kopyasız)
+
+    np.roll iki ayrı tam kopya üretir; burada tek np.empty_like tamponu
+    dilimleme ile doldurulur ve alan + çevre aynı tamponu paylaşır.
+    """
+    shifted = np.empty_like(points)
+    shifted[:-1] = points[1:]
+    shifted[-1] = points[0]
+    return shifted
+
+
+def _polygon_metrics_np(points):
+    """Alan (işaretli) ve çevreyi paylaşılan kaydırılmış dizi ile hesapla"""
+    shifted = _shift_vertices(points)
+    cross = points[:, 0] * shifted[:, 1] - shifted[:, 0] * points[:, 1]
+    area = float(cross.sum()) / 2
+    perimeter = float(np.hypot(shifted[:, 0] - points[:, 0],
+                               shifted[:, 1] - points[:, 1]).sum())
+    return area, perimeter
+
+
+# numba varsa polyline metrikleri tek geçişli derlenmiş çekirdekle hesaplanır;
+# yoksa numpy tabanlı yol kullanılır
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _polyline_metrics(points):
+        """Alan, çevre ve sınır kutusunu tek döngüde, ara dizi olmadan hesapla"""
+        n = points.shape[0]
+        area = 0.0
+        perimeter = 0.0
+        min_x = points[0, 0]
+        max_x = min_x
+        min_y = points[0, 1]
+        max_y = min_y
+
+        for i in range(n):
+            x = points[i, 0]
+            y = points[i, 1]
+            j = i + 1 if i + 1 < n else 0
+            xj = points[j, 0]
+            yj = points[j, 1]
+
+            area += x * yj - xj * y
+            dx = xj - x
+            dy = yj - y
+            perimeter += math.hypot(dx, dy)
+
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
+
+        return area / 2, perimeter, min_x, max_x, min_y, max_y
+
+    @njit(cache=True, fastmath=True)
+    def _reduce_stats(areas, lengths):
+        """Toplam/min/max alan ve toplam uzunluğu tek döngüde indirge
+
+        Dört ayrı ndarray indirgemesi diziyi dört kez tarar; füzyonlu
+        döngü aynı sonuçları tek bellek geçişinde çıkarır.
+        """
+        total = 0.0
+        mn = areas[0]
+        mx = areas[0]
+        total_len = 0.0
+        for i in range(areas.shape[0]):
+            a = areas[i]
+            total += a
+            if a < mn:
+                mn = a
+            elif a > mx:
+                mx = a
+            total_len += lengths[i]
+        return total, mn, mx, total_len
+
+    @njit(cache=True)
+    def _count_over(values, threshold):
+        """Eşiği aşan değer sayısı: geçici bool maskesi ayırmadan tek döngü"""
+        count = 0
+        for i in range(values.shape[0]):
+            if values[i] > threshold:
+                count += 1
+        return count
+
+    @njit(cache=True)
+    def _count_min_under(a, b, threshold):
+        """min(a_i, b_i) < eşik olan eleman sayısı (kesit dar kenarı taraması)
+
+        CIRCLE/LINE kaynaklı kayıtlarda her iki kesit alanı 0 kalır; bu
+        kayıtlar boyut bilgisi taşımadığından taramaya katılmaz, yoksa
+        her dairesel kolon yanlış pozitif verirdi.
+        """
+        count = 0
+        for i in range(a.shape[0]):
+            if a[i] <= 0.0 or b[i] <= 0.0:
+                continue
+            narrow = a[i] if a[i] < b[i] else b[i]
+            if narrow < threshold:
+                count += 1
+        return count
+else:
+    def _reduce_stats(areas, lengths):
+        return float(areas.sum()), float(areas.min()), float(areas.max()), float(lengths.sum())
+
+    def _count_over(values, threshold):
+        return int((values > threshold).sum())
+
+    def _count_min_under(a, b, threshold):
+        # Boyutu 0 olan (CIRCLE/LINE kaynaklı) kayıtlar taramaya girmez
+        return int(((a > 0) & (b > 0) & (np.minimum(a, b) < threshold)).sum())
+
+
+def _warmup_kernels():
+    """Numba çekirdeklerini import sırasında minik girdilerle tetikle
+
+    cache=True derlenen makine kodunu diskte tutar ama ilk çağrı yine de
+    önbellek yükleme/tip çözme maliyeti öder; burada ödenir ki kullanıcının
+    ilk analizi beklemesin. Numba yoksa fallback'ler zaten anında döner.
+    """
+    tiny = np.zeros(1, dtype=np.float64)
+    tiny_xy = np.zeros((3, 2), dtype=np.float64)
+    _reduce_stats(tiny, tiny)
+    _count_over(tiny, 0.0)
+    _count_min_under(tiny, tiny, 0.0)
+    if HAS_NUMBA:
+        _polyline_metrics(tiny_xy)
+
+
+_warmup_kernels()
+
+
+# orjson varsa JSON raporu C hızında serileştirilir (numpy tiplerini de destekler)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps_json_report(report_data):
+    """Rapor verisini JSON byte dizisine çevir (orjson varsa onu kullan)"""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            report_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(report_data, indent=2, ensure_ascii=False).encode('utf-8')
 
 # Sayfa konfigürasyonu
 st.set_page_config(
@@ -22,6 +267,15 @@ st.set_page_config(
 )
 
 class StructuralElementAnalyzer:
+    # __dict__ yerine slot tanımlayıcıları: örnek başına daha az bellek,
+    # sıcak yolda daha hızlı öznitelik erişimi ve yazım hatasıyla sessizce
+    # yeni alan oluşmasına karşı koruma
+    __slots__ = (
+        'elements', 'coords', 'arrays', 'total_entities',
+        'analysis_results', 'check_results', 'check_flags',
+        'totals', 'layer_keywords'
+    )
+
     def __init__(self):
         self.elements = {
             'kolon': [],
@@ -30,13 +284,24 @@ class StructuralElementAnalyzer:
             'döşeme': [],
             'temel': []
         }
-        self.layer_keywords = {
-            'kolon': ['kolon', 'column', 'col', 'pillar', 'c-'],
-            'kiriş': ['kiriş', 'kiriş', 'beam', 'b-', 'kirish'],
-            'perde': ['perde', 'wall', 'shear', 'w-', 'duvar'],
-            'döşeme': ['döşeme', 'slab', 'floor', 'f-', 'doseme'],
-            'temel': ['temel', 'foundation', 'found', 'foot', 'fd-']
-        }
+        # Eleman tipi başına (N,2) koordinat dizisi; analiz sonunda doldurulur.
+        # Grafikler ve mekansal kontroller tek tek tuple açmak yerine doğrudan
+        # bu dizilerin sütunlarını kullanır.
+        self.coords: Dict[str, np.ndarray] = {}
+        # Tip başına sayısal sütun dizileri (SoA): istatistikler ve statik
+        # kontroller dict listelerini taramak yerine bu dizileri kullanır
+        self.arrays: Dict[str, Dict[str, np.ndarray]] = {}
+        # Son analizde modelspace'te bulunan toplam entity sayısı
+        self.total_entities = 0
+        # get_summary_statistics sonucu; analiz başına bir kez hesaplanır
+        self.analysis_results = None
+        # perform_structural_checks sonucu; rerun'larda yeniden koşmaz
+        self.check_results = None
+        # Kriter başına bool bayraklar; UI tablosu metin taramadan okur
+        self.check_flags = {}
+        # Analizle birlikte hesaplanan genel toplamlar (eleman sayısı, alan)
+        self.totals = {'elements': 0, 'area': 0.0}
+        self.layer_keywords = LAYER_KEYWORDS
     
     def convert_dwg_to_dxf(self, dwg_file):
         """DWG dosyasını LibreCAD kullanarak DXF'ye dönüştür"""
@@ -57,16 +322,16 @@ class StructuralElementAnalyzer:
                 ]
                 
                 for path in possible_paths:
-                    if shutil.which(path):
+                    if find_tool(path):
                         return True, path
                         
                 # PATH'ta arama
-                if shutil.which("librecad"):
+                if find_tool("librecad"):
                     return True, "librecad"
                     
             else:
                 # Linux/macOS için
-                if shutil.which("librecad"):
+                if find_tool("librecad"):
                     result = subprocess.run(
                         ['librecad', '--version'],
                         capture_output=True,
@@ -128,7 +393,7 @@ class StructuralElementAnalyzer:
             )
             
             # Sonuç kontrol et
-            if os.path.exists(temp_dxf_path) and os.path.getsize(temp_dxf_path) > 0:
+            if file_has_content(temp_dxf_path):
                 st.success("✅ DWG dosyası başarıyla DXF'ye dönüştürüldü!")
                 return temp_dxf_path
             else:
@@ -152,81 +417,114 @@ class StructuralElementAnalyzer:
                 pass
     
     def try_alternative_conversion(self, dwg_file):
-        """Alternatif dönüştürme yöntemleri dene"""
+        """Alternatif dönüştürme yöntemlerini paralel dene
+
+        Dönüştürücüler bağımsız subprocess'ler olduğu için hepsi aynı anda
+        başlatılır; ilk başarılı sonuç hemen döndürülür. Executor context
+        manager olmadan kurulur ve shutdown(wait=False) ile bırakılır,
+        yoksa __exit__ tüm worker'ları join eder ve en yavaş dönüştürücü
+        bitene kadar bloklanırdı. Başlamış subprocess'ler arka planda
+        tamamlanıp kendi çıktı dosyalarına yazar; sonuç beklenmez.
+        """
         st.warning("🔧 LibreCAD bulunamadı. Alternatif yöntemler deneniyor...")
-        
-        # FreeCAD'i dene (eğer varsa)
-        if shutil.which("freecad"):
-            st.info("FreeCAD ile dönüştürme deneniyor...")
-            return self.convert_with_freecad(dwg_file)
-        
-        # QCAD'i dene (eğer varsa)  
-        if shutil.which("qcad"):
-            st.info("QCAD ile dönüştürme deneniyor...")
-            return self.convert_with_qcad(dwg_file)
-        
-        # Hiçbiri yoksa demo dosya oluştur
-        st.info("📝 Dönüştürme araçları bulunamadı. Demo dosyası kullanılıyor.")
-        self.show_installation_instructions()
+
+        methods = []
+        if find_tool("freecad"):
+            methods.append(('FreeCAD', self.convert_with_freecad))
+        if find_tool("qcad"):
+            methods.append(('QCAD', self.convert_with_qcad))
+
+        if not methods:
+            # Hiçbiri yoksa demo dosya oluştur
+            st.info("📝 Dönüştürme araçları bulunamadı. Demo dosyası kullanılıyor.")
+            self.show_installation_instructions()
+            return self.create_demo_dxf()
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.dwg') as temp_dwg:
+            temp_dwg.write(dwg_file.read())
+            temp_dwg_path = temp_dwg.name
+
+        # Context manager kullanılmaz: __exit__ shutdown(wait=True) ile tüm
+        # worker'ları join eder ve kazanan belli olduktan sonra bile en yavaş
+        # dönüştürücünün bitmesini beklerdi
+        executor = ThreadPoolExecutor(max_workers=len(methods))
+        try:
+            # Her yöntem kendi çıktı dosyasına yazar ki yarış oluşmasın
+            futures = {
+                executor.submit(
+                    method,
+                    temp_dwg_path,
+                    temp_dwg_path.replace('.dwg', f'.{name.lower()}.dxf')
+                ): name
+                for name, method in methods
+            }
+
+            for future in as_completed(futures, timeout=120):
+                try:
+                    result = future.result()
+                except Exception:
+                    continue
+                if result:
+                    st.success(f"✅ {futures[future]} ile dönüştürme başarılı!")
+                    return result
+        except Exception:
+            pass
+        finally:
+            # Kuyrukta bekleyenler iptal edilir, çalışan worker'lar join
+            # edilmeden arka planda bitmeye bırakılır; kazanan döndükten
+            # sonra en yavaş dönüştürücü beklenmez
+            executor.shutdown(wait=False, cancel_futures=True)
+            try:
+                os.unlink(temp_dwg_path)
+            except OSError:
+                pass
+
+        st.info("📝 Dönüştürme tamamlanamadı. Demo dosyası kullanılıyor.")
         return self.create_demo_dxf()
-    
-    def convert_with_freecad(self, dwg_file):
-        """FreeCAD ile dönüştürme (alternatif)"""
+
+    def convert_with_freecad(self, dwg_path, dxf_path):
+        """FreeCAD ile dönüştürme (worker; başarısızsa None)"""
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.dwg') as temp_dwg:
-                temp_dwg.write(dwg_file.read())
-                temp_dwg_path = temp_dwg.name
-            
-            temp_dxf_path = temp_dwg_path.replace('.dwg', '.dxf')
-            
             # FreeCAD Python scripti
             script = f"""
 import FreeCAD
 import Import
 doc = FreeCAD.newDocument()
-Import.insert("{temp_dwg_path}", doc.Name)
-Import.export(doc.Objects, "{temp_dxf_path}")
+Import.insert("{dwg_path}", doc.Name)
+Import.export(doc.Objects, "{dxf_path}")
 FreeCAD.closeDocument(doc.Name)
 """
-            
+
             with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as script_file:
                 script_file.write(script)
                 script_path = script_file.name
-            
-            result = subprocess.run([
+
+            subprocess.run([
                 'freecad', '--console', '--run-python', script_path
             ], capture_output=True, timeout=30)
-            
-            if os.path.exists(temp_dxf_path):
-                st.success("✅ FreeCAD ile dönüştürme başarılı!")
-                return temp_dxf_path
-                
-        except Exception as e:
-            st.warning(f"FreeCAD dönüştürme hatası: {str(e)}")
-            
-        return self.create_demo_dxf()
-    
-    def convert_with_qcad(self, dwg_file):
-        """QCAD ile dönüştürme (alternatif)"""
+
+            if file_has_content(dxf_path):
+                return dxf_path
+
+        except Exception:
+            pass
+
+        return None
+
+    def convert_with_qcad(self, dwg_path, dxf_path):
+        """QCAD ile dönüştürme (worker; başarısızsa None)"""
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.dwg') as temp_dwg:
-                temp_dwg.write(dwg_file.read())
-                temp_dwg_path = temp_dwg.name
-            
-            temp_dxf_path = temp_dwg_path.replace('.dwg', '.dxf')
-            
-            result = subprocess.run([
-                'qcad', '-batch', '-input', temp_dwg_path, '-output', temp_dxf_path
+            subprocess.run([
+                'qcad', '-batch', '-input', dwg_path, '-output', dxf_path
             ], capture_output=True, timeout=30)
-            
-            if os.path.exists(temp_dxf_path):
-                st.success("✅ QCAD ile dönüştürme başarılı!")
-                return temp_dxf_path
-                
-        except Exception as e:
-            st.warning(f"QCAD dönüştürme hatası: {str(e)}")
-            
-        return self.create_demo_dxf()
+
+            if file_has_content(dxf_path):
+                return dxf_path
+
+        except Exception:
+            pass
+
+        return None
     
     def show_installation_instructions(self):
         """Kurulum talimatlarını göster"""
@@ -281,43 +579,50 @@ FreeCAD.closeDocument(doc.Name)
         doc.layers.new(name='DÖŞEME', dxfattribs={'color': 4})
         doc.layers.new(name='TEMEL', dxfattribs={'color': 5})
         
-        # Demo elemanlar ekle
-        # Kolonlar
-        for i in range(5):
-            x, y = i * 5, 0
-            msp.add_lwpolyline(
-                [(x, y), (x+0.5, y), (x+0.5, y+0.5), (x, y+0.5)],
-                close=True,
-                dxfattribs={'layer': 'KOLON'}
-            )
-        
-        # Kirişler
-        for i in range(4):
-            x1, x2 = i * 5 + 0.5, (i+1) * 5
-            msp.add_line((x1, 0.25), (x2, 0.25), dxfattribs={'layer': 'KIRIŞ'})
-        
+        # Demo elemanlar ekle: tüm köşe koordinatları numpy broadcast ile
+        # eleman döngüsünden önce tek seferde üretilir; döngüler yalnızca
+        # hazır dizileri ezdxf'e aktarır. dxfattribs sözlükleri katman
+        # başına tek örnek olarak paylaşılır
+        axis_x = np.arange(5) * 5.0
+        kolon_attr = {'layer': 'KOLON'}
+        kiris_attr = {'layer': 'KIRIŞ'}
+        temel_attr = {'layer': 'TEMEL'}
+
+        # Kolonlar: (N,4,2) köşe dizisi = aks tabanı + 0.5 m kare ofsetleri
+        kolon_offsets = np.array([(0, 0), (0.5, 0), (0.5, 0.5), (0, 0.5)])
+        kolon_base = np.stack([axis_x, np.zeros_like(axis_x)], axis=1)
+        for quad in kolon_base[:, None, :] + kolon_offsets:
+            msp.add_lwpolyline(quad, close=True, dxfattribs=kolon_attr)
+
+        # Kirişler: uç koordinatları tek vektörel işlemle
+        beam_x1 = axis_x[:-1] + 0.5
+        beam_x2 = axis_x[1:]
+        for x1, x2 in zip(beam_x1, beam_x2):
+            msp.add_line((x1, 0.25), (x2, 0.25), dxfattribs=kiris_attr)
+
         # Perde
         msp.add_lwpolyline(
             [(0, -2), (20, -2), (20, -1.8), (0, -1.8)],
             close=True,
             dxfattribs={'layer': 'PERDE'}
         )
-        
+
         # Döşeme
         msp.add_lwpolyline(
             [(-1, -1), (21, -1), (21, 1), (-1, 1)],
             close=True,
             dxfattribs={'layer': 'DÖŞEME'}
         )
-        
-        # Temel
-        for i in range(5):
-            x, y = i * 5 - 0.2, -3
-            msp.add_lwpolyline(
-                [(x, y), (x+0.9, y), (x+0.9, y+0.8), (x, y+0.8)],
-                close=True,
-                dxfattribs={'layer': 'TEMEL'}
-            )
+
+        # Temeller: kolonlarla aynı broadcast kalıbı, 0.9x0.8 m pabuçlar.
+        # Pabuçlar kolon merkezlerinin altına ortalanır ki demo çizim
+        # KD-tree temel eşleştirme kontrolünden uyarısız geçsin
+        temel_offsets = np.array([(0, 0), (0.9, 0), (0.9, 0.8), (0, 0.8)])
+        temel_base = np.stack(
+            [axis_x - 0.2, np.full_like(axis_x, -0.15)], axis=1
+        )
+        for quad in temel_base[:, None, :] + temel_offsets:
+            msp.add_lwpolyline(quad, close=True, dxfattribs=temel_attr)
         
         # Geçici dosyaya kaydet
         temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.dxf')
@@ -327,71 +632,272 @@ FreeCAD.closeDocument(doc.Name)
     def analyze_dxf(self, dxf_path):
         """DXF dosyasını analiz et"""
         try:
+            # Çok büyük dosyalarda DOM kurmak yerine akış analizine geç
+            if os.path.getsize(dxf_path) > LARGE_DXF_STREAM_THRESHOLD:
+                return self._analyze_dxf_streaming(dxf_path)
+
             doc = ezdxf.readfile(dxf_path)
             msp = doc.modelspace()
-            
+
+            # Modelspace __len__ desteği sayesinde entity'leri listeye
+            # kopyalamadan sayabiliyoruz
+            self.total_entities = len(msp)
+
             # Elemanları sıfırla
             for key in self.elements:
                 self.elements[key] = []
-            
-            # Her entity için analiz yap
-            for entity in msp:
-                layer_name = entity.dxf.layer.lower()
-                element_type = self.classify_element(layer_name)
-                
+
+            # Desteklenen tipleri ezdxf query() ile gruplayarak dolaş:
+            # alakasız entity'ler (TEXT, DIMENSION, ...) hiç ele alınmaz ve
+            # tip başına ayrı döngü sayesinde dxftype() karşılaştırması
+            # tamamen ortadan kalkar. LINE ve CIRCLE gibi sabit alanlı tipler
+            # ham koordinat listelerinde biriktirilip numpy ile toplu
+            # hesaplanır; değişken uzunluklu polyline'lar yerinde işlenir
+            line_types, line_coords = [], []
+            circle_types, circle_data = [], []
+
+            # Katman adları dosya başına bir kez küçük harfe çevrilip
+            # sınıflandırılır; entity döngüleri ham katman adıyla sözlükten
+            # okur, entity başına .lower() allocation'ı kalmaz
+            layer_map = {
+                layer.dxf.name: classify_layer(layer.dxf.name.lower().strip())
+                for layer in doc.layers
+            }
+
+            def layer_type(name):
+                try:
+                    return layer_map[name]
+                except KeyError:
+                    # Katman tablosunda tanımsız katmana çizilmiş entity
+                    element_type = classify_layer(name.lower().strip())
+                    layer_map[name] = element_type
+                    return element_type
+
+            for entity in msp.query('LINE'):
+                element_type = layer_type(entity.dxf.layer)
                 if element_type:
-                    element_data = self.extract_element_data(entity, element_type)
+                    start, end = entity.dxf.start, entity.dxf.end
+                    line_types.append(element_type)
+                    line_coords.append((start[0], start[1], end[0], end[1]))
+
+            for entity in msp.query('CIRCLE'):
+                element_type = layer_type(entity.dxf.layer)
+                if element_type:
+                    center = entity.dxf.center
+                    circle_types.append(element_type)
+                    circle_data.append((center[0], center[1], entity.dxf.radius))
+
+            for entity in msp.query('LWPOLYLINE POLYLINE'):
+                element_type = layer_type(entity.dxf.layer)
+                if element_type:
+                    # Tek bozuk entity tüm dosyanın analizini düşürmesin
+                    try:
+                        element_data = self.analyze_polyline(entity, element_type)
+                    except Exception:
+                        continue
                     if element_data:
                         self.elements[element_type].append(element_data)
-            
+
+            self._append_line_elements(line_types, line_coords)
+            self._append_circle_elements(circle_types, circle_data)
+            self._build_coordinate_arrays()
+
             return True
             
         except Exception as e:
             st.error(f"DXF analiz hatası: {str(e)}")
             return False
     
+    def _analyze_dxf_streaming(self, dxf_path):
+        """Büyük DXF dosyalarını iterdxf ile akış halinde analiz et
+
+        ezdxf.readfile tüm entity veritabanını belleğe kurar; iterdxf ise
+        entity'leri tek geçişlik generator olarak verir. Analiz zaten tek
+        geçiş olduğu için sonuç aynıdır, tepe bellek kullanımı düşer.
+        """
+        try:
+            for key in self.elements:
+                self.elements[key] = []
+
+            line_types, line_coords = [], []
+            circle_types, circle_data = [], []
+            total_entities = 0
+
+            doc = iterdxf.opendxf(dxf_path)
+            try:
+                for entity in doc.modelspace():
+                    total_entities += 1
+                    dxftype = entity.dxftype()
+
+                    if dxftype == 'LINE':
+                        element_type = classify_layer(entity.dxf.layer.lower())
+                        if element_type:
+                            start, end = entity.dxf.start, entity.dxf.end
+                            line_types.append(element_type)
+                            line_coords.append((start[0], start[1], end[0], end[1]))
+                    elif dxftype == 'CIRCLE':
+                        element_type = classify_layer(entity.dxf.layer.lower())
+                        if element_type:
+                            center = entity.dxf.center
+                            circle_types.append(element_type)
+                            circle_data.append((center[0], center[1], entity.dxf.radius))
+                    elif dxftype in ('LWPOLYLINE', 'POLYLINE'):
+                        element_type = classify_layer(entity.dxf.layer.lower())
+                        if element_type:
+                            # Tek bozuk entity akış analizini düşürmesin
+                            try:
+                                element_data = self.analyze_polyline(entity, element_type)
+                            except Exception:
+                                continue
+                            if element_data:
+                                self.elements[element_type].append(element_data)
+            finally:
+                doc.close()
+
+            self.total_entities = total_entities
+            self._append_line_elements(line_types, line_coords)
+            self._append_circle_elements(circle_types, circle_data)
+            self._build_coordinate_arrays()
+
+            return True
+
+        except Exception as e:
+            st.error(f"DXF analiz hatası: {str(e)}")
+            return False
+
+    def _build_coordinate_arrays(self):
+        """Eleman verilerini tip başına sütun dizilerinde (SoA) topla
+
+        Dict listesi UI tablosu için korunur; sayısal sıcak yollar
+        (istatistikler, kontroller, grafikler) buradaki bitişik float64
+        dizileri üzerinden çalışır.
+        """
+        self.coords = {}
+        self.arrays = {}
+        # Eleman kümesi değişti; önbellekteki kontrol sonuçlarını geçersiz kıl
+        self.check_results = None
+        self.check_flags = {}
+        stats = {}
+
+        for element_type, elements in self.elements.items():
+            # Tip başına tek (N,5) kayıt matrisi: sütunlar aynı bitişik
+            # tampon üzerinde görünümdür, alan başına ayrı materialize yok
+            if elements:
+                records = np.array([
+                    (e.get('alan', 0), e.get('uzunluk', 0), e.get('genişlik', 0),
+                     e['koordinat'][0], e['koordinat'][1])
+                    for e in elements
+                ], dtype=np.float64)
+            else:
+                records = np.empty((0, 5), dtype=np.float64)
+
+            self.coords[element_type] = records[:, 3:5]
+            self.arrays[element_type] = {
+                'alan': records[:, 0],
+                'uzunluk': records[:, 1],
+                'genişlik': records[:, 2]
+            }
+
+            # Diziler zaten sıcakken özet istatistikleri aynı geçişte çıkar;
+            # sonraki çağrılar (KPI'lar, kontroller, raporlar) tekrar tarama
+            # yapmadan hazır sözlüğü okur
+            if len(elements):
+                # Füzyonlu indirgeme: dört ayrı tarama yerine tek geçiş
+                total_area, min_area, max_area, total_length = _reduce_stats(
+                    np.ascontiguousarray(records[:, 0]),
+                    np.ascontiguousarray(records[:, 1])
+                )
+                stats[element_type] = {
+                    'adet': len(elements),
+                    'toplam_alan': float(total_area),
+                    'ortalama_alan': float(total_area) / len(elements),
+                    'min_alan': float(min_area),
+                    'max_alan': float(max_area),
+                    'toplam_uzunluk': float(total_length)
+                }
+            else:
+                stats[element_type] = {
+                    'adet': 0,
+                    'toplam_alan': 0,
+                    'ortalama_alan': 0,
+                    'min_alan': 0,
+                    'max_alan': 0,
+                    'toplam_uzunluk': 0
+                }
+
+        self.analysis_results = stats
+        # Rerun başına sum() gezintisi yapmamak için genel toplamlar da
+        # analizle birlikte bir kez çıkarılır
+        self.totals = {
+            'elements': sum(s['adet'] for s in stats.values()),
+            'area': sum(s['toplam_alan'] for s in stats.values())
+        }
+
     def classify_element(self, layer_name):
         """Katman adına göre eleman tipini belirle"""
-        for element_type, keywords in self.layer_keywords.items():
-            if any(keyword in layer_name for keyword in keywords):
-                return element_type
-        return None
-    
-    def extract_element_data(self, entity, element_type):
-        """Entity'den eleman verilerini çıkar"""
-        try:
-            if entity.dxftype() == 'LWPOLYLINE':
-                return self.analyze_polyline(entity, element_type)
-            elif entity.dxftype() == 'LINE':
-                return self.analyze_line(entity, element_type)
-            elif entity.dxftype() == 'CIRCLE':
-                return self.analyze_circle(entity, element_type)
-            elif entity.dxftype() == 'RECTANGLE':
-                return self.analyze_rectangle(entity, element_type)
-        except:
-            pass
-        return None
+        return classify_layer(layer_name)
     
+    def _append_line_elements(self, types, coords):
+        """Biriktirilen LINE koordinatlarından uzunlukları toplu hesapla"""
+        if not coords:
+            return
+
+        arr = np.asarray(coords, dtype=np.float64)
+        lengths = np.hypot(arr[:, 2] - arr[:, 0], arr[:, 3] - arr[:, 1])
+        midpoints = (arr[:, :2] + arr[:, 2:]) / 2
+
+        for element_type, length, mid in zip(types, lengths, midpoints):
+            self.elements[element_type].append({
+                'tip': element_type,
+                'uzunluk': float(length),
+                'alan': 0,
+                'genişlik': 0,
+                'koordinat': (float(mid[0]), float(mid[1]))
+            })
+
+    def _append_circle_elements(self, types, data):
+        """Biriktirilen CIRCLE verilerinden alan/çevreyi toplu hesapla"""
+        if not data:
+            return
+
+        arr = np.asarray(data, dtype=np.float64)
+        radii = arr[:, 2]
+        areas = math.pi * radii ** 2
+        perimeters = 2 * math.pi * radii
+
+        for element_type, row, area, perimeter in zip(types, arr, areas, perimeters):
+            self.elements[element_type].append({
+                'tip': element_type,
+                'alan': float(area),
+                'çevre': float(perimeter),
+                'çap': float(row[2] * 2),
+                'koordinat': (float(row[0]), float(row[1]))
+            })
+
     def analyze_polyline(self, polyline, element_type):
         """Polyline analizi"""
-        points = list(polyline.vertices())
+        # Köşe noktalarını tek seferde (N,2) diziye çevir; alan, çevre ve
+        # sınır kutusu aynı dizi üzerinden vektörel hesaplanır. LWPOLYLINE
+        # noktaları get_points ile okunur; eski tip POLYLINE'da vertices
+        # bir liste attribute'üdür, noktalar points() üzerinden gelir
+        if polyline.dxftype() == 'LWPOLYLINE':
+            raw = polyline.get_points('xy')
+        else:
+            raw = [(v.x, v.y) for v in polyline.points()]
+        points = np.asarray(raw, dtype=np.float64)
         if len(points) < 3:
             return None
-        
-        # Alan hesapla
-        area = self.calculate_polygon_area(points)
-        
-        # Çevre hesapla
-        perimeter = self.calculate_perimeter(points)
-        
-        # Boyutları hesapla
-        min_x = min(p[0] for p in points)
-        max_x = max(p[0] for p in points)
-        min_y = min(p[1] for p in points)
-        max_y = max(p[1] for p in points)
-        
-        width = max_x - min_x
-        length = max_y - min_y
+
+        if HAS_NUMBA:
+            # Tek geçişli çekirdek: alan + çevre + sınır kutusu, ara dizi yok
+            area, perimeter, min_x, max_x, min_y, max_y = _polyline_metrics(points)
+        else:
+            area, perimeter = _polygon_metrics_np(points)
+            min_x, min_y = points.min(axis=0)
+            max_x, max_y = points.max(axis=0)
+
+        width = float(max_x - min_x)
+        length = float(max_y - min_y)
         
         return {
             'tip': element_type,
@@ -399,123 +905,445 @@ FreeCAD.closeDocument(doc.Name)
             'çevre': perimeter,
             'genişlik': width,
             'uzunluk': length,
-            'koordinat': ((min_x + max_x) / 2, (min_y + max_y) / 2)
-        }
-    
-    def analyze_line(self, line, element_type):
-        """Çizgi analizi"""
-        start = line.dxf.start
-        end = line.dxf.end
-        
-        length = math.sqrt((end[0] - start[0])**2 + (end[1] - start[1])**2)
-        
-        return {
-            'tip': element_type,
-            'uzunluk': length,
-            'alan': 0,
-            'genişlik': 0,
-            'koordinat': ((start[0] + end[0]) / 2, (start[1] + end[1]) / 2)
-        }
-    
-    def analyze_circle(self, circle, element_type):
-        """Daire analizi"""
-        radius = circle.dxf.radius
-        area = math.pi * radius ** 2
-        perimeter = 2 * math.pi * radius
-        
-        return {
-            'tip': element_type,
-            'alan': area,
-            'çevre': perimeter,
-            'çap': radius * 2,
-            'koordinat': (circle.dxf.center[0], circle.dxf.center[1])
+            'koordinat': (float(min_x + max_x) / 2, float(min_y + max_y) / 2)
         }
     
     def calculate_polygon_area(self, points):
-        """Polygon alanı hesapla (Shoelace formula)"""
-        n = len(points)
-        if n < 3:
-            return 0
-        
-        area = 0
-        for i in range(n):
-            j = (i + 1) % n
-            area += points[i][0] * points[j][1]
-            area -= points[j][0] * points[i][1]
-        
-        return area / 2
-    
+        """Polygon alanı hesapla (Shoelace formula, utils çekirdeği)"""
+        return GeometryUtils.calculate_polygon_area(points)
+
     def calculate_perimeter(self, points):
-        """Çevre hesapla"""
-        if len(points) < 2:
-            return 0
-        
-        perimeter = 0
-        for i in range(len(points)):
-            next_i = (i + 1) % len(points)
-            dx = points[next_i][0] - points[i][0]
-            dy = points[next_i][1] - points[i][1]
-            perimeter += math.sqrt(dx**2 + dy**2)
-        
-        return perimeter
+        """Çevre hesapla (utils çekirdeği)"""
+        return GeometryUtils.calculate_perimeter(points)
     
+    def fingerprint(self):
+        """Analiz durumunu özetleyen hafif önbellek anahtarı
+
+        Büyük dizileri hash'lemek yerine tip başına adet, toplam alan ve
+        koordinat toplamından oluşan küçük bir tuple döndürür; Streamlit
+        önbellek anahtarı olarak kullanılır.
+        """
+        return tuple(
+            (element_type,
+             arrays['alan'].size,
+             float(arrays['alan'].sum()),
+             float(self.coords[element_type].sum()))
+            for element_type, arrays in self.arrays.items()
+        )
+
     def get_summary_statistics(self):
-        """Özet istatistikler"""
-        stats = {}
-        
-        for element_type, elements in self.elements.items():
-            if elements:
-                stats[element_type] = {
-                    'adet': len(elements),
-                    'toplam_alan': sum(e.get('alan', 0) for e in elements),
-                    'ortalama_alan': np.mean([e.get('alan', 0) for e in elements]),
-                    'toplam_uzunluk': sum(e.get('uzunluk', 0) for e in elements)
-                }
-            else:
-                stats[element_type] = {
-                    'adet': 0,
-                    'toplam_alan': 0,
-                    'ortalama_alan': 0,
-                    'toplam_uzunluk': 0
-                }
-        
-        return stats
+        """Özet istatistikler (analiz sırasında hazırlanan sözlük)"""
+        if self.analysis_results is None:
+            # Analiz henüz koşmadıysa boş dizilerle aynı yapıyı kur
+            self._build_coordinate_arrays()
+        return self.analysis_results
     
     def perform_structural_checks(self, stats):
-        """Statik kontroller"""
+        """Statik kontroller (analiz başına bir kez koşar)
+
+        Streamlit her widget etkileşiminde script'i yeniden çalıştırır;
+        eleman kümesi değişmediği sürece sonuç listesi önbellekten döner.
+        """
+        if self.check_results is not None:
+            return self.check_results
+
         warnings = []
+        # Her kriter için bool bayrak: UI kriter tablosu uyarı metinlerinde
+        # substring aramak yerine doğrudan bayrakları okur
+        flags = {
+            'perde_orani': False,
+            'kucuk_kolon': False,
+            'kolon_yogunlugu': False,
+            'uzun_kiris': False,
+            'asimetrik_yerlesim': False,
+            'eksik_temel': False
+        }
         
         # Toplam döşeme alanı
         total_floor_area = stats.get('döşeme', {}).get('toplam_alan', 0)
         total_wall_area = stats.get('perde', {}).get('toplam_alan', 0)
         
+        # Eşikler yerel değişkende: sıcak tarama ve format ifadelerinde
+        # tekrar tekrar global sözlük araması yapılmaz
+        min_wall_ratio = MIN_WALL_RATIO
+        max_area_per_column = MAX_AREA_PER_COLUMN
+        max_beam_span = MAX_BEAM_SPAN
+
         # Perde alanı oranı kontrolü (döşeme alanının %1'i minimum)
         if total_floor_area > 0:
             wall_ratio = (total_wall_area / total_floor_area) * 100
-            if wall_ratio < 1.0:
-                warnings.append(f"⚠️ Perde alanı oranı düşük: %{wall_ratio:.1f} (Minimum %1.0 önerilir)")
+            if wall_ratio < min_wall_ratio:
+                flags['perde_orani'] = True
+                warnings.append(
+                    f"⚠️ Perde alanı oranı düşük: %{wall_ratio:.1f} "
+                    f"(Minimum %{min_wall_ratio:.1f} önerilir)"
+                )
         
+        # Minimum kolon boyutu kontrolü: kesitin dar kenarı numba varsa jit
+        # sayım çekirdeğiyle, yoksa tek vektörel maskeyle taranır
+        column_arrays = self.arrays.get('kolon', {})
+        column_widths = column_arrays.get('genişlik')
+        if column_widths is not None and column_widths.size:
+            small_columns = _count_min_under(
+                column_widths, column_arrays['uzunluk'], MIN_COLUMN_SIZE
+            )
+            if small_columns:
+                flags['kucuk_kolon'] = True
+                warnings.append(
+                    f"⚠️ {small_columns} adet kolon {MIN_COLUMN_SIZE*100:.0f}x"
+                    f"{MIN_COLUMN_SIZE*100:.0f} cm minimum kesitin altında"
+                )
+
         # Kolon sayısı kontrolü
         column_count = stats.get('kolon', {}).get('adet', 0)
         if total_floor_area > 0:
             area_per_column = total_floor_area / max(column_count, 1)
-            if area_per_column > 25:  # 25 m²'den fazla alan per kolon
-                warnings.append(f"⚠️ Kolon yoğunluğu düşük: {area_per_column:.1f} m²/kolon (Max 25 m²/kolon önerilir)")
+            if area_per_column > max_area_per_column:
+                flags['kolon_yogunlugu'] = True
+                warnings.append(
+                    f"⚠️ Kolon yoğunluğu düşük: {area_per_column:.1f} m²/kolon "
+                    f"(Max {max_area_per_column:.0f} m²/kolon önerilir)"
+                )
         
-        # Kiriş açıklığı kontrolü
-        beam_elements = self.elements.get('kiriş', [])
-        long_beams = [b for b in beam_elements if b.get('uzunluk', 0) > 8]
-        if long_beams:
-            warnings.append(f"⚠️ {len(long_beams)} adet kiriş 8m'den uzun (Açıklık kontrolü gerekli)")
+        # Kiriş açıklığı kontrolü (SoA dizisi üzerinde jit/vektörel sayım)
+        beam_lengths = self.arrays.get('kiriş', {}).get('uzunluk')
+        if beam_lengths is not None and beam_lengths.size:
+            long_beams = _count_over(beam_lengths, max_beam_span)
+            if long_beams:
+                flags['uzun_kiris'] = True
+                warnings.append(
+                    f"⚠️ {long_beams} adet kiriş {max_beam_span:.0f}m'den uzun "
+                    f"(Açıklık kontrolü gerekli)"
+                )
         
-        # Temel kontrolü
+        # Simetri kontrolü: kolonların kütle merkezi ile medyan merkezi
+        # arasındaki sapma, bitişik (N,2) dizi üzerinde iki indirgemeyle
+        # hesaplanır — eleman başına koordinat açan döngü yok
+        symmetry_xy = self.coords.get('kolon')
+        if symmetry_xy is not None and len(symmetry_xy) >= 4:
+            center = symmetry_xy.mean(axis=0)
+            median_center = np.median(symmetry_xy, axis=0)
+            deviation = math.hypot(center[0] - median_center[0],
+                                   center[1] - median_center[1])
+            if deviation > SYMMETRY_DEVIATION_LIMIT:
+                flags['asimetrik_yerlesim'] = True
+                warnings.append(
+                    f"⚠️ Kolon yerleşimi asimetrik: kütle merkezi sapması {deviation:.2f} m"
+                )
+
+        # Temel kontrolü: scipy varsa her kolonu en yakın temele KD-tree ile
+        # eşleştir (adet karşılaştırması temellerin yanlış yerde olduğu
+        # durumu yakalayamaz), yoksa adet karşılaştırmasına düş
         column_count = stats.get('kolon', {}).get('adet', 0)
         foundation_count = stats.get('temel', {}).get('adet', 0)
-        if foundation_count < column_count:
+        column_xy = self.coords.get('kolon')
+        foundation_xy = self.coords.get('temel')
+
+        if HAS_SCIPY and column_xy is not None and len(column_xy) and len(foundation_xy):
+            tree = cKDTree(foundation_xy)
+            dists, _ = tree.query(column_xy, k=1)
+            unmatched = int((dists > FOUNDATION_MATCH_TOLERANCE).sum())
+            if unmatched:
+                flags['eksik_temel'] = True
+                warnings.append(
+                    f"⚠️ {unmatched} kolonun {FOUNDATION_MATCH_TOLERANCE:.1f} m "
+                    f"yakınında temel bulunamadı"
+                )
+        elif foundation_count < column_count:
+            flags['eksik_temel'] = True
             warnings.append(f"⚠️ Temel sayısı yetersiz: {foundation_count} temel / {column_count} kolon")
-        
+
+        self.check_flags = flags
+        self.check_results = warnings
         return warnings
 
+@st.cache_resource(show_spinner=False)
+def load_and_analyze(file_name: str, file_bytes: bytes):
+    """Dosyayı dönüştür, analiz et ve analyzer'ı döndür (başarısızsa None)
+
+    DWG dönüştürme ve DXF ayrıştırma yüklemenin en pahalı adımları;
+    Streamlit her widget etkileşiminde script'i baştan çalıştırdığı için
+    sonuç dosya içeriğiyle anahtarlanarak önbelleğe alınır. cache_resource
+    aynı analyzer örneğini döndürür: rerun'lar dönüştürücüleri ve ezdxf'i
+    çalıştırmadığı gibi analyzer'ı pickle kopyasından da geçirmez, böylece
+    üzerindeki memoize edilmiş istatistik/kontrol sonuçları da kalıcı olur.
+    Analyzer analizden sonra salt okunur kullanıldığı için örnek paylaşımı
+    güvenlidir.
+    """
+    analyzer = StructuralElementAnalyzer()
+
+    if file_name.lower().endswith('.dwg'):
+        dxf_path = analyzer.convert_dwg_to_dxf(io.BytesIO(file_bytes))
+    else:
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.dxf') as temp_file:
+            temp_file.write(file_bytes)
+            dxf_path = temp_file.name
+
+    try:
+        if dxf_path and analyzer.analyze_dxf(dxf_path):
+            return analyzer
+        return None
+    finally:
+        try:
+            if dxf_path:
+                os.unlink(dxf_path)
+        except OSError:
+            pass
+
+
+# Grafik oluşturucular: Plotly figure kurulumu ve JSON'a serileştirme
+# maliyetli olduğu için modül seviyesinde tanımlanıp önbelleğe alınır.
+# Fonksiyonlar go.Figure yerine hazır plotly JSON sözlüğü döndürür;
+# st.plotly_chart sözlüğü doğrudan kabul eder ve rerun'larda figure kurma
+# + to_json adımlarının ikisi de atlanır. Argümanlar tuple olarak geçilir
+# ki cache anahtarı ucuza hesaplansın.
+@st.cache_data(show_spinner=False)
+def build_pie_figure(labels: tuple, areas: tuple):
+    """Alan dağılımı pasta grafiği"""
+    fig = px.pie(values=areas, names=labels, title="Eleman Alan Dağılımı")
+    fig.update_layout(height=400)
+    return fig.to_plotly_json()
+
+
+@st.cache_data(show_spinner=False)
+def build_count_bar_figure(names: tuple, counts: tuple):
+    """Eleman adet karşılaştırma grafiği"""
+    fig = px.bar(
+        x=names,
+        y=counts,
+        title="Eleman Adet Karşılaştırması",
+        color=counts,
+        color_continuous_scale="viridis"
+    )
+    fig.update_layout(height=400)
+    return fig.to_plotly_json()
+
+
+@st.cache_data(show_spinner=False)
+def build_area_bar_figure(names: tuple, areas: tuple):
+    """Toplam alan karşılaştırma grafiği"""
+    fig = px.bar(
+        x=names,
+        y=areas,
+        title="Toplam Alan Karşılaştırması (m²)",
+        color=areas,
+        color_continuous_scale="plasma"
+    )
+    fig.update_layout(height=400)
+    return fig.to_plotly_json()
+
+
+@st.cache_data(show_spinner=False)
+def build_csv_report(fingerprint: tuple, stats: dict) -> str:
+    """CSV rapor içeriğini üret (fingerprint değişmedikçe önbellekten)"""
+    # Sütunsal kurulum: pandas hücre hücre Python nesnesi ayrıştırmak
+    # yerine hazır ndarray'leri sıfır kopya sütun olarak sarar
+    types = list(stats.keys())
+    count = len(types)
+    report_frame = pd.DataFrame({
+        'Eleman Tipi': [t.capitalize() for t in types],
+        'Adet': np.fromiter(
+            (stats[t]['adet'] for t in types), dtype=np.int64, count=count
+        ),
+        'Toplam Alan (m²)': np.fromiter(
+            (stats[t]['toplam_alan'] for t in types), dtype=np.float64, count=count
+        ).round(2),
+        'Ortalama Alan (m²)': np.fromiter(
+            (stats[t]['ortalama_alan'] for t in types), dtype=np.float64, count=count
+        ).round(2),
+        'Toplam Uzunluk (m)': np.fromiter(
+            (stats[t]['toplam_uzunluk'] for t in types), dtype=np.float64, count=count
+        ).round(2)
+    })
+
+    csv_buffer = io.StringIO()
+    report_frame.to_csv(csv_buffer, index=False, encoding='utf-8')
+    return csv_buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def build_detail_table(fingerprint: tuple, element_type: str, _elements: list, _coords: np.ndarray) -> pd.DataFrame:
+    """Seçili tipin detay tablosunu kur (fingerprint değişmedikçe önbellekten)
+
+    Her rerun'da DataFrame'i yeniden kurmamak için eleman listesi
+    fingerprint+tip ile temsil edilir; _elements/_coords hash'lenmez.
+    """
+    df = pd.DataFrame(_elements)
+
+    # Koordinat sütununu düzenle (toplu koordinat dizisinden)
+    if 'koordinat' in df.columns:
+        df['X'] = _coords[:, 0].round(1)
+        df['Y'] = _coords[:, 1].round(1)
+        df = df.drop('koordinat', axis=1)
+
+    # Sayısal sütunları düzenle
+    numeric_columns = ['alan', 'uzunluk', 'genişlik', 'çevre', 'çap']
+    for col in numeric_columns:
+        if col in df.columns:
+            df[col] = df[col].round(2)
+
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def build_json_report(fingerprint: tuple, file_name: str, stats: dict, _elements: dict) -> bytes:
+    """JSON rapor baytlarını üret (fingerprint değişmedikçe önbellekten)
+
+    Eleman listesi fingerprint tarafından temsil edildiği için _elements
+    önbellek anahtarına dahil edilmez.
+    """
+    json_report = {
+        'proje': {
+            'dosya': file_name,
+            'tarih': pd.Timestamp.now().isoformat()
+        },
+        'istatistikler': stats,
+        'elemanlar': _elements
+    }
+    return dumps_json_report(json_report)
+
+
+def _rectangle_outlines(centers, widths, heights):
+    """Dikdörtgen konturlarını NaN ayraçlı tek koordinat çiftine paketle
+
+    Plotly NaN gördüğü yerde çizgiyi böler; böylece N dikdörtgen tek
+    scatter izi olarak çizilir, eleman başına ayrı shape/iz maliyeti olmaz.
+    """
+    x0 = centers[:, 0] - widths / 2
+    x1 = centers[:, 0] + widths / 2
+    y0 = centers[:, 1] - heights / 2
+    y1 = centers[:, 1] + heights / 2
+    gap = np.full_like(x0, np.nan)
+
+    xs = np.column_stack([x0, x1, x1, x0, x0, gap]).ravel()
+    ys = np.column_stack([y0, y0, y1, y1, y0, gap]).ravel()
+    return xs, ys
+
+
+@st.cache_data(show_spinner=False)
+def build_layout_figure(_coords_by_type: dict, _arrays_by_type: dict, fingerprint: tuple):
+    """Eleman yerleşim planı: tip başına en fazla iki scatter izi
+
+    Boyutu bilinen elemanlar kontur dikdörtgeni olarak tek toplu izde,
+    çizgisel elemanlar (kirişler vb.) orta noktalarından işaretçi olarak
+    çizilir. fingerprint önbellek anahtarıdır, diziler hash'lenmez.
+    """
+    fig = go.Figure()
+    for element_type, xy in _coords_by_type.items():
+        if not len(xy):
+            continue
+
+        arrays = _arrays_by_type[element_type]
+        widths = arrays['genişlik']
+        heights = arrays['uzunluk']
+        has_footprint = (widths > 0) & (heights > 0)
+
+        if has_footprint.any():
+            xs, ys = _rectangle_outlines(
+                xy[has_footprint], widths[has_footprint], heights[has_footprint]
+            )
+            fig.add_trace(go.Scatter(
+                x=xs,
+                y=ys,
+                mode='lines',
+                name=element_type.capitalize()
+            ))
+
+        # Kolon kesit etiketleri: tek text izinde toplu; kalabalık planlarda
+        # (50+ kolon) etiket başına yazı maliyeti görünür olmadan atlanır
+        if element_type == 'kolon' and 0 < has_footprint.sum() <= MAX_LABELED_COLUMNS:
+            label_w = widths[has_footprint]
+            label_h = heights[has_footprint]
+            fig.add_trace(go.Scatter(
+                x=xy[has_footprint, 0],
+                y=xy[has_footprint, 1],
+                mode='text',
+                text=[f"{w*100:.0f}x{h*100:.0f}" for w, h in zip(label_w, label_h)],
+                textfont=dict(size=9),
+                showlegend=False,
+                hoverinfo='skip'
+            ))
+
+        remaining = ~has_footprint
+        if remaining.any():
+            fig.add_trace(go.Scatter(
+                x=xy[remaining, 0],
+                y=xy[remaining, 1],
+                mode='markers',
+                name=f"{element_type.capitalize()} (orta nokta)"
+            ))
+
+    fig.update_layout(
+        title="Eleman Yerleşim Planı",
+        height=500,
+        xaxis_title="X (m)",
+        yaxis_title="Y (m)"
+    )
+    fig.update_yaxes(scaleanchor="x", scaleratio=1)
+    return fig.to_plotly_json()
+
+
+@st.cache_data(show_spinner=False)
+def build_density_figure(_coords_by_type: dict, fingerprint: tuple, bins: int = 20):
+    """Eleman yoğunluğu ısı haritası: tek np.histogram2d geçişiyle
+
+    Tüm tiplerin koordinatları concatenate edilip binleme tek vektörel
+    çağrıda yapılır; satır satır digitize/artırma döngüsü yoktur.
+    fingerprint önbellek anahtarıdır, diziler hash'lenmez.
+    """
+    stacks = [xy for xy in _coords_by_type.values() if len(xy)]
+    fig = go.Figure()
+    if stacks:
+        all_xy = np.concatenate(stacks)
+        heatmap, y_edges, x_edges = np.histogram2d(
+            all_xy[:, 1], all_xy[:, 0], bins=bins
+        )
+        fig.add_trace(go.Heatmap(
+            z=heatmap,
+            x=x_edges,
+            y=y_edges,
+            colorscale='YlOrRd',
+            colorbar_title="Eleman sayısı"
+        ))
+
+    fig.update_layout(
+        title="Eleman Yoğunluğu Isı Haritası",
+        height=500,
+        xaxis_title="X (m)",
+        yaxis_title="Y (m)"
+    )
+    return fig.to_plotly_json()
+
+
+@st.cache_data(show_spinner=False)
+def build_detail_figure(names: tuple, counts: tuple, areas: tuple, avg_areas: tuple):
+    """Detay analiz alt grafikleri"""
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=("Eleman Adetleri", "Toplam Alanlar", "Ortalama Alanlar", "Oransal Dağılım"),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}],
+               [{"secondary_y": False}, {"type": "pie"}]]
+    )
+
+    fig.add_trace(go.Bar(x=list(names), y=list(counts), name="Adet"), row=1, col=1)
+    fig.add_trace(go.Bar(x=list(names), y=list(areas), name="Alan"), row=1, col=2)
+    fig.add_trace(
+        go.Scatter(x=list(names), y=list(avg_areas), mode='lines+markers', name="Ort. Alan"),
+        row=2, col=1
+    )
+
+    non_zero_areas = [(name, area) for name, area in zip(names, areas) if area > 0]
+    if non_zero_areas:
+        pie_labels, pie_values = zip(*non_zero_areas)
+        fig.add_trace(
+            go.Pie(labels=list(pie_labels), values=list(pie_values), name="Dağılım"),
+            row=2, col=2
+        )
+
+    fig.update_layout(height=600, showlegend=False)
+    return fig.to_plotly_json()
+
+
 # Streamlit UI
 def main():
     st.title("🏗️ DWG/DXF Yapı Elemanı Analizi")
@@ -530,27 +1358,24 @@ def main():
     )
     
     if uploaded_file is not None:
-        # Analyzer oluştur
-        analyzer = StructuralElementAnalyzer()
-        
         with st.spinner('Dosya işleniyor...'):
-            # Dosya tipine göre işle
-            if uploaded_file.name.lower().endswith('.dwg'):
-                st.info("DWG dosyası DXF'ye dönüştürülüyor...")
-                dxf_path = analyzer.convert_dwg_to_dxf(uploaded_file)
-            else:
-                # DXF dosyasını geçici olarak kaydet
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.dxf') as temp_file:
-                    temp_file.write(uploaded_file.read())
-                    dxf_path = temp_file.name
-            
-            if dxf_path and analyzer.analyze_dxf(dxf_path):
+            # Dönüştürme + analiz dosya içeriğine göre önbelleğe alınır;
+            # widget etkileşimi kaynaklı rerun'larda yeniden çalışmaz
+            analyzer = load_and_analyze(uploaded_file.name, uploaded_file.getvalue())
+
+            if analyzer is not None:
                 # Ana içerik
                 col1, col2 = st.columns([2, 1])
                 
                 with col1:
                     st.header("📊 Analiz Sonuçları")
-                    
+                    st.caption(
+                        f"Modelspace'te {analyzer.total_entities} entity tarandı — "
+                        f"{analyzer.totals['elements']} yapısal eleman, "
+                        f"{analyzer.totals['area']:.1f} m² toplam alan"
+                    )
+
+
                     # İstatistikler
                     stats = analyzer.get_summary_statistics()
                     
@@ -580,20 +1405,11 @@ def main():
                     )
                     
                     if analyzer.elements[selected_element]:
-                        df = pd.DataFrame(analyzer.elements[selected_element])
-                        
-                        # Koordinat sütununu düzenle
-                        if 'koordinat' in df.columns:
-                            df['X'] = df['koordinat'].apply(lambda x: f"{x[0]:.1f}")
-                            df['Y'] = df['koordinat'].apply(lambda x: f"{x[1]:.1f}")
-                            df = df.drop('koordinat', axis=1)
-                        
-                        # Sayısal sütunları düzenle
-                        numeric_columns = ['alan', 'uzunluk', 'genişlik', 'çevre', 'çap']
-                        for col in numeric_columns:
-                            if col in df.columns:
-                                df[col] = df[col].round(2)
-                        
+                        df = build_detail_table(
+                            analyzer.fingerprint(), selected_element,
+                            _elements=analyzer.elements[selected_element],
+                            _coords=analyzer.coords[selected_element]
+                        )
                         st.dataframe(df, use_container_width=True)
                     else:
                         st.info(f"Bu projede {selected_element} elemanı bulunamadı.")
@@ -605,10 +1421,29 @@ def main():
                     warnings = analyzer.perform_structural_checks(stats)
                     
                     if warnings:
-                        for warning in warnings:
-                            st.warning(warning)
+                        # Tek widget'ta birleştir: uyarı başına ayrı
+                        # st.warning elemanı yerine tek yerleşim geçişi
+                        st.warning("\n\n".join(warnings))
                     else:
                         st.success("✅ Tüm temel kontroller başarılı!")
+
+                    # Kriter tablosu: kontrol bayrakları doğrudan okunur,
+                    # uyarı metinlerinde substring aranmaz
+                    criteria_labels = {
+                        'perde_orani': 'Perde alanı oranı',
+                        'kucuk_kolon': 'Minimum kolon kesiti',
+                        'kolon_yogunlugu': 'Kolon yoğunluğu',
+                        'uzun_kiris': 'Kiriş açıklığı',
+                        'asimetrik_yerlesim': 'Yerleşim simetrisi',
+                        'eksik_temel': 'Kolon-temel eşleşmesi'
+                    }
+                    st.table(pd.DataFrame({
+                        'Kriter': [criteria_labels[k] for k in criteria_labels],
+                        'Durum': [
+                            '⚠️' if analyzer.check_flags.get(k) else '✅'
+                            for k in criteria_labels
+                        ]
+                    }))
                     
                     # Alan dağılımı
                     st.subheader("📈 Alan Dağılımı")
@@ -617,12 +1452,7 @@ def main():
                     labels = [key.capitalize() for key in element_keys if stats[key]['toplam_alan'] > 0]
                     
                     if areas:
-                        fig_pie = px.pie(
-                            values=areas,
-                            names=labels,
-                            title="Eleman Alan Dağılımı"
-                        )
-                        fig_pie.update_layout(height=400)
+                        fig_pie = build_pie_figure(tuple(labels), tuple(areas))
                         st.plotly_chart(fig_pie, use_container_width=True)
                 
                 # Alt bölüm - Grafikler
@@ -631,118 +1461,69 @@ def main():
                 # Grafik seçenekleri
                 chart_type = st.radio(
                     "Grafik tipi seçin:",
-                    options=["Adet Karşılaştırması", "Alan Karşılaştırması", "Detay Analiz"],
+                    options=["Adet Karşılaştırması", "Alan Karşılaştırması",
+                             "Yerleşim Planı", "Yerleşim Isı Haritası",
+                             "Detay Analiz"],
                     horizontal=True
                 )
                 
+                chart_names = tuple(key.capitalize() for key in element_keys)
+
                 if chart_type == "Adet Karşılaştırması":
-                    counts = [stats[key]['adet'] for key in element_keys]
-                    fig_bar = px.bar(
-                        x=[key.capitalize() for key in element_keys],
-                        y=counts,
-                        title="Eleman Adet Karşılaştırması",
-                        color=counts,
-                        color_continuous_scale="viridis"
-                    )
-                    fig_bar.update_layout(height=400)
+                    counts = tuple(stats[key]['adet'] for key in element_keys)
+                    fig_bar = build_count_bar_figure(chart_names, counts)
                     st.plotly_chart(fig_bar, use_container_width=True)
-                
+
                 elif chart_type == "Alan Karşılaştırması":
-                    areas = [stats[key]['toplam_alan'] for key in element_keys]
-                    fig_area = px.bar(
-                        x=[key.capitalize() for key in element_keys],
-                        y=areas,
-                        title="Toplam Alan Karşılaştırması (m²)",
-                        color=areas,
-                        color_continuous_scale="plasma"
-                    )
-                    fig_area.update_layout(height=400)
+                    areas = tuple(stats[key]['toplam_alan'] for key in element_keys)
+                    fig_area = build_area_bar_figure(chart_names, areas)
                     st.plotly_chart(fig_area, use_container_width=True)
-                
+
+                elif chart_type == "Yerleşim Planı":
+                    fig_layout = build_layout_figure(analyzer.coords, analyzer.arrays, analyzer.fingerprint())
+                    st.plotly_chart(fig_layout, use_container_width=True)
+
+                elif chart_type == "Yerleşim Isı Haritası":
+                    fig_heatmap = build_density_figure(analyzer.coords, analyzer.fingerprint())
+                    st.plotly_chart(fig_heatmap, use_container_width=True)
+
                 else:  # Detay Analiz
-                    # Subplots oluştur
-                    fig = make_subplots(
-                        rows=2, cols=2,
-                        subplot_titles=("Eleman Adetleri", "Toplam Alanlar", "Ortalama Alanlar", "Oransal Dağılım"),
-                        specs=[[{"secondary_y": False}, {"secondary_y": False}],
-                               [{"secondary_y": False}, {"type": "pie"}]]
-                    )
-                    
-                    # Eleman adetleri
-                    counts = [stats[key]['adet'] for key in element_keys]
-                    fig.add_trace(
-                        go.Bar(x=[key.capitalize() for key in element_keys], y=counts, name="Adet"),
-                        row=1, col=1
-                    )
-                    
-                    # Toplam alanlar
-                    areas = [stats[key]['toplam_alan'] for key in element_keys]
-                    fig.add_trace(
-                        go.Bar(x=[key.capitalize() for key in element_keys], y=areas, name="Alan"),
-                        row=1, col=2
-                    )
-                    
-                    # Ortalama alanlar
-                    avg_areas = [stats[key]['ortalama_alan'] for key in element_keys]
-                    fig.add_trace(
-                        go.Scatter(x=[key.capitalize() for key in element_keys], y=avg_areas, 
-                                 mode='lines+markers', name="Ort. Alan"),
-                        row=2, col=1
-                    )
-                    
-                    # Pie chart
-                    non_zero_areas = [(key.capitalize(), area) for key, area in 
-                                    zip(element_keys, areas) if area > 0]
-                    if non_zero_areas:
-                        labels, values = zip(*non_zero_areas)
-                        fig.add_trace(
-                            go.Pie(labels=labels, values=values, name="Dağılım"),
-                            row=2, col=2
-                        )
-                    
-                    fig.update_layout(height=600, showlegend=False)
+                    counts = tuple(stats[key]['adet'] for key in element_keys)
+                    areas = tuple(stats[key]['toplam_alan'] for key in element_keys)
+                    avg_areas = tuple(stats[key]['ortalama_alan'] for key in element_keys)
+                    fig = build_detail_figure(chart_names, counts, areas, avg_areas)
                     st.plotly_chart(fig, use_container_width=True)
                 
                 # Rapor indirme
                 st.header("📄 Rapor")
                 
                 if st.button("📊 Analiz Raporunu İndir"):
-                    # CSV raporu oluştur
-                    report_data = []
-                    for element_type in element_keys:
-                        stat = stats[element_type]
-                        report_data.append({
-                            'Eleman Tipi': element_type.capitalize(),
-                            'Adet': stat['adet'],
-                            'Toplam Alan (m²)': round(stat['toplam_alan'], 2),
-                            'Ortalama Alan (m²)': round(stat['ortalama_alan'], 2),
-                            'Toplam Uzunluk (m)': round(stat['toplam_uzunluk'], 2)
-                        })
-                    
-                    report_df = pd.DataFrame(report_data)
-                    
-                    # CSV'yi string'e çevir
-                    csv_buffer = io.StringIO()
-                    report_df.to_csv(csv_buffer, index=False, encoding='utf-8')
-                    csv_data = csv_buffer.getvalue()
-                    
+                    # Rapor içerikleri fingerprint ile önbelleğe alınır;
+                    # buton/rerun döngüsünde yeniden serileştirme olmaz
+                    report_fingerprint = analyzer.fingerprint()
+                    csv_data = build_csv_report(report_fingerprint, stats)
+                    json_data = build_json_report(
+                        report_fingerprint, uploaded_file.name, stats, analyzer.elements
+                    )
+                    report_stamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
+
                     st.download_button(
                         label="📁 CSV Raporu İndir",
                         data=csv_data,
-                        file_name=f"yapi_analiz_raporu_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                        file_name=f"yapi_analiz_raporu_{report_stamp}.csv",
                         mime="text/csv"
                     )
+
+                    st.download_button(
+                        label="📁 JSON Raporu İndir",
+                        data=json_data,
+                        file_name=f"yapi_analiz_raporu_{report_stamp}.json",
+                        mime="application/json"
+                    )
             
             else:
                 st.error("Dosya analiz edilemedi. Lütfen geçerli bir DWG/DXF dosyası yükleyin.")
-        
-        # Geçici dosyaları temizle
-        try:
-            if 'dxf_path' in locals() and dxf_path:
-                os.unlink(dxf_path)
-        except:
-            pass
-    
+
     else:
         # Başlangıç sayfası
         st.markdown("""
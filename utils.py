@@ -0,0 +1,719 @@
+"""Yapısal analiz için sayısal yardımcılar
+
+Geometri çekirdekleri burada toplanır ki app.py dışında da (ör. toplu
+işleme betikleri) kullanılabilsinler. Numba varsa çekirdekler
+@njit(cache=True, fastmath=True) ile derlenir; yoksa aynı sonuçları
+veren vektörel NumPy yolları devreye girer.
+"""
+
+import functools
+import math
+import os
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Bu boyutun altında paralel çekirdeğin iş parçacığı havuzu kurulumu
+# kazançtan pahalıdır; küçük diziler tek iş parçacıklı çekirdekte kalır
+PARALLEL_STATS_THRESHOLD = 10_000
+
+
+def _as_xy_array(points):
+    """Nokta listesini/dizisini/Polygon'u bitişik (N,2) float64 dizisine çevir
+
+    Zaten bitişik (N,2) float64 olan ndarray kopyasız aynen döner; böylece
+    hazırlanmış diziyle art arda çağrılar (alan + çevre + bbox + merkez)
+    dönüşüm maliyetini yalnızca bir kez öder.
+    """
+    if isinstance(points, np.ndarray):
+        if (points.dtype == np.float64 and points.ndim == 2
+                and points.shape[1] == 2 and points.flags.c_contiguous):
+            return points
+    elif isinstance(points, Polygon):
+        return np.column_stack((points.xs, points.ys))
+    xy = np.asarray(points, dtype=np.float64)
+    if xy.ndim != 2 or xy.shape[1] < 2:
+        xy = xy.reshape(-1, 2)
+    return np.ascontiguousarray(xy[:, :2])
+
+
+def _shifted(column):
+    """Sütunun bir kaydırılmış kopyası (np.roll'un çift kopyası yerine)"""
+    out = np.empty_like(column)
+    out[:-1] = column[1:]
+    out[-1] = column[0]
+    return out
+
+
+@dataclass
+class Polygon:
+    """SoA köşe depolama: xs/ys ayrı bitişik float64 tamponları
+
+    Tuple listesi nokta başına PyObject maliyeti öder; burada iki düz
+    tampon önbellek dostu kalır ve eksen indirgemeleri kopyasız çalışır.
+    GeometryUtils metotları Polygon'u da nokta listesi gibi kabul eder.
+    """
+    xs: np.ndarray
+    ys: np.ndarray
+
+    @classmethod
+    def from_points(cls, points):
+        arr = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return cls(np.ascontiguousarray(arr[:, 0]),
+                   np.ascontiguousarray(arr[:, 1]))
+
+    def __len__(self):
+        return self.xs.shape[0]
+
+    def bounding_box(self):
+        """(min_x, min_y, max_x, max_y) — sütun başına tek indirgeme"""
+        if not len(self):
+            return (0.0, 0.0, 0.0, 0.0)
+        return (float(self.xs.min()), float(self.ys.min()),
+                float(self.xs.max()), float(self.ys.max()))
+
+    def centroid(self):
+        """Köşe ortalaması (x, y)"""
+        if not len(self):
+            return (0.0, 0.0)
+        return (float(self.xs.mean()), float(self.ys.mean()))
+
+    def area(self):
+        return GeometryUtils.calculate_polygon_area(self)
+
+    def perimeter(self):
+        return GeometryUtils.calculate_perimeter(self)
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _shoelace(xy):
+        """İşaretli polygon alanı: Shoelace formülü, tek döngü"""
+        n = xy.shape[0]
+        total = 0.0
+        for i in range(n):
+            j = i + 1 if i + 1 < n else 0
+            total += xy[i, 0] * xy[j, 1] - xy[j, 0] * xy[i, 1]
+        return total / 2
+
+    @njit(cache=True, fastmath=True)
+    def _perimeter(xy):
+        """Kapalı polygon çevresi: kenar uzunluklarının tek döngüde toplamı"""
+        n = xy.shape[0]
+        total = 0.0
+        for i in range(n):
+            j = i + 1 if i + 1 < n else 0
+            dx = xy[j, 0] - xy[i, 0]
+            dy = xy[j, 1] - xy[i, 1]
+            total += math.hypot(dx, dy)
+        return total
+else:
+    def _shoelace(xy):
+        # İki dot product: N uzunluklu çapraz-fark ara dizisi materialize
+        # etmeden BLAS tek SIMD geçişiyle indirger
+        xs = xy[:, 0]
+        ys = xy[:, 1]
+        return float(xs @ _shifted(ys) - ys @ _shifted(xs)) / 2
+
+    def _perimeter(xy):
+        xs = xy[:, 0]
+        ys = xy[:, 1]
+        return float(np.hypot(_shifted(xs) - xs, _shifted(ys) - ys).sum())
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _basic_stats(values):
+        """Toplam, min, max ve kareler toplamını tek döngüde indirge"""
+        total = 0.0
+        sq_total = 0.0
+        mn = values[0]
+        mx = values[0]
+        for i in range(values.shape[0]):
+            v = values[i]
+            total += v
+            sq_total += v * v
+            if v < mn:
+                mn = v
+            elif v > mx:
+                mx = v
+        return total, sq_total, mn, mx
+
+    @njit(cache=True, boundscheck=False)
+    def _pip_kernel(qx, qy, poly):
+        """Işın gönderme (ray casting) ile nokta-poligon içerme testi
+
+        Sorgu noktaları toplu işlenir; kenar döngüsü sorgu başına derlenmiş
+        kodda döner. xinters dallanmadan önce sıfırlanır ki tanımsız
+        değişken yolu oluşmasın.
+        """
+        n_poly = poly.shape[0]
+        result = np.zeros(qx.shape[0], dtype=np.bool_)
+        for k in range(qx.shape[0]):
+            x = qx[k]
+            y = qy[k]
+            inside = False
+            x1 = poly[0, 0]
+            y1 = poly[0, 1]
+            for i in range(1, n_poly + 1):
+                x2 = poly[i % n_poly, 0]
+                y2 = poly[i % n_poly, 1]
+                xinters = 0.0
+                if min(y1, y2) < y <= max(y1, y2) and x <= max(x1, x2):
+                    if y1 != y2:
+                        xinters = (y - y1) * (x2 - x1) / (y2 - y1) + x1
+                    if x1 == x2 or x <= xinters:
+                        inside = not inside
+                x1 = x2
+                y1 = y2
+            result[k] = inside
+        return result
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _basic_stats_par(values):
+        """_basic_stats'in prange ile çekirdeklere dağıtılan sürümü"""
+        total = 0.0
+        sq_total = 0.0
+        mn = values[0]
+        mx = values[0]
+        for i in prange(values.shape[0]):
+            v = values[i]
+            total += v
+            sq_total += v * v
+            mn = min(mn, v)
+            mx = max(mx, v)
+        return total, sq_total, mn, mx
+else:
+    def _basic_stats(values):
+        return (float(values.sum()), float((values * values).sum()),
+                float(values.min()), float(values.max()))
+
+    _basic_stats_par = _basic_stats
+
+    def _pip_kernel(qx, qy, poly):
+        """Işın gönderme testinin vektörel NumPy yolu
+
+        Az sayıda kenar üzerinde döner, her kenarda tüm sorgu noktaları
+        tek maske işlemiyle değerlendirilir. Yatay kenarlar koşulu hiçbir
+        zaman sağlamadığı için sıfıra bölme oluşmaz.
+        """
+        inside = np.zeros(qx.shape[0], dtype=np.bool_)
+        n_poly = poly.shape[0]
+        x1 = poly[0, 0]
+        y1 = poly[0, 1]
+        for i in range(1, n_poly + 1):
+            x2 = poly[i % n_poly, 0]
+            y2 = poly[i % n_poly, 1]
+            if y1 != y2:
+                cond = ((np.minimum(y1, y2) < qy) & (qy <= np.maximum(y1, y2))
+                        & (qx <= max(x1, x2)))
+                xinters = (qy - y1) * (x2 - x1) / (y2 - y1) + x1
+                inside ^= cond & ((x1 == x2) | (qx <= xinters))
+            x1 = x2
+            y1 = y2
+        return inside
+
+
+def _warmup_kernels():
+    """Çekirdekleri import sırasında minik girdilerle derlet/yükle
+
+    cache=True ilk süreçte derleneni diskte saklar; sonraki süreçlerde bu
+    çağrı yalnızca önbellekten yükler. İlk kullanıcı isteği JIT beklemez.
+    """
+    if HAS_NUMBA:
+        tiny = np.zeros(1, dtype=np.float64)
+        tiny_xy = np.zeros((3, 2), dtype=np.float64)
+        _shoelace(tiny_xy)
+        _perimeter(tiny_xy)
+        _basic_stats(tiny)
+        _basic_stats_par(tiny)
+        _pip_kernel(tiny, tiny, tiny_xy)
+
+
+_warmup_kernels()
+
+
+class CachedPolygon:
+    """Tekrarlı içerme sorguları için hazırlanmış poligon
+
+    Sınır kutusu ile merkez + maksimum yarıçap karesi bir kez hesaplanır;
+    contains() önce bu ucuz testlerle bariz dışarıdaki sorguları eler ve
+    ışın gönderme çekirdeğini yalnızca adaylar için çalıştırır. Dağınık
+    sorgularda yaygın durum O(1)'e iner.
+    """
+
+    __slots__ = ('xy', 'min_x', 'min_y', 'max_x', 'max_y', 'cx', 'cy', 'r2_max')
+
+    def __init__(self, points):
+        self.xy = _as_xy_array(points)
+        if len(self.xy):
+            xs = self.xy[:, 0]
+            ys = self.xy[:, 1]
+            self.min_x = float(xs.min())
+            self.max_x = float(xs.max())
+            self.min_y = float(ys.min())
+            self.max_y = float(ys.max())
+            self.cx = float(xs.mean())
+            self.cy = float(ys.mean())
+            self.r2_max = float(((xs - self.cx) ** 2 + (ys - self.cy) ** 2).max())
+        else:
+            self.min_x = self.max_x = self.min_y = self.max_y = 0.0
+            self.cx = self.cy = self.r2_max = 0.0
+
+    def contains_point(self, point):
+        """Tek nokta: skaler erken çıkışlar, gerekirse çekirdek"""
+        x, y = float(point[0]), float(point[1])
+        if x < self.min_x or x > self.max_x or y < self.min_y or y > self.max_y:
+            return False
+        dx = x - self.cx
+        dy = y - self.cy
+        if dx * dx + dy * dy > self.r2_max:
+            return False
+        return GeometryUtils.is_point_in_polygon((x, y), self.xy)
+
+    def contains(self, points):
+        """Toplu sorgu: kutu/yarıçap maskeleriyle eleyip kalanı çekirdeğe ver"""
+        qxy = _as_xy_array(points)
+        result = np.zeros(len(qxy), dtype=np.bool_)
+        if len(self.xy) < 3 or not len(qxy):
+            return result
+
+        qx = qxy[:, 0]
+        qy = qxy[:, 1]
+        candidate = ((qx >= self.min_x) & (qx <= self.max_x)
+                     & (qy >= self.min_y) & (qy <= self.max_y))
+        if candidate.any():
+            idx = np.flatnonzero(candidate)
+            dx = qx[idx] - self.cx
+            dy = qy[idx] - self.cy
+            idx = idx[dx * dx + dy * dy <= self.r2_max]
+            if idx.size:
+                result[idx] = _pip_kernel(
+                    np.ascontiguousarray(qx[idx]),
+                    np.ascontiguousarray(qy[idx]),
+                    self.xy
+                )
+        return result
+
+
+class PreparedPolygon:
+    """Kenar değişmezleri önceden hesaplanmış poligon
+
+    Aynı poligon çok sayıda noktaya karşı test edilecekse kenar başına
+    sabit olan (y - y1) * (x2 - x1) / (y2 - y1) + x1 ifadesinin bölme
+    kısmı bir kez çözülür; sorgu başına kalan iş kenar vektörleri
+    üzerinde karşılaştırmalar ve tek bir çarp-topla (FMA) olur. Yatay
+    kenarlarda inv_dy 0'a sabitlenir; bu kenarlar zaten y-aralığı
+    koşulunu sağlamadığından sonucu etkilemez.
+    """
+
+    __slots__ = ('x1', 'y1', 'slope_x', 'ymin', 'ymax', 'xmax', 'vertical')
+
+    def __init__(self, points):
+        xy = _as_xy_array(points)
+        if not len(xy):
+            # Boş girdi: kenar dizileri boş kalır, contains* çağrıları
+            # köşe sayısı korumasıyla CachedPolygon gibi False'a düşer
+            empty = np.empty(0, dtype=np.float64)
+            self.x1 = self.y1 = self.slope_x = empty
+            self.ymin = self.ymax = self.xmax = empty
+            self.vertical = np.empty(0, dtype=np.bool_)
+            return
+        xs = np.ascontiguousarray(xy[:, 0])
+        ys = np.ascontiguousarray(xy[:, 1])
+        x2 = _shifted(xs)
+        y2 = _shifted(ys)
+        dy = y2 - ys
+        inv_dy = np.divide(1.0, dy, out=np.zeros_like(dy), where=dy != 0.0)
+        self.x1 = xs
+        self.y1 = ys
+        self.slope_x = (x2 - xs) * inv_dy
+        self.ymin = np.minimum(ys, y2)
+        self.ymax = np.maximum(ys, y2)
+        self.xmax = np.maximum(xs, x2)
+        self.vertical = xs == x2
+
+    def contains_point(self, point):
+        """Tek nokta testi: kenar dizileri üzerinde tek vektörel geçiş"""
+        if self.x1.shape[0] < 3:
+            return False
+        x, y = float(point[0]), float(point[1])
+        cand = (self.ymin < y) & (y <= self.ymax) & (x <= self.xmax)
+        xinters = (y - self.y1) * self.slope_x + self.x1
+        crossings = cand & (self.vertical | (x <= xinters))
+        return bool(np.count_nonzero(crossings) & 1)
+
+    def contains(self, points):
+        """Toplu test: (N, E) broadcast, kenar ekseninde geçiş sayımı"""
+        qxy = _as_xy_array(points)
+        if self.x1.shape[0] < 3 or not len(qxy):
+            return np.zeros(len(qxy), dtype=np.bool_)
+        qx = qxy[:, 0:1]
+        qy = qxy[:, 1:2]
+        cand = (self.ymin < qy) & (qy <= self.ymax) & (qx <= self.xmax)
+        xinters = (qy - self.y1) * self.slope_x + self.x1
+        crossings = cand & (self.vertical | (qx <= xinters))
+        return (crossings.sum(axis=1) & 1).astype(np.bool_)
+
+
+class GeometryUtils:
+    """Polygon geometrisi yardımcıları (durumsuz, statik metotlar)"""
+
+    @staticmethod
+    def prepare(points):
+        """Noktaları bir kez (N,2) float64 dizisine çevirip geri ver
+
+        "Bir kez çevir, çok kez hesapla" deseni: çağıran dönen diziyi
+        elinde tutarsa alan/çevre/bbox/merkez çağrılarının her biri
+        kopyasız hızlı yoldan geçer, liste -> ndarray dönüşümü tekrar
+        tekrar ödenmez.
+        """
+        return _as_xy_array(points)
+
+    @staticmethod
+    def calculate_polygon_area(points):
+        """Polygon alanı (Shoelace formülü, işaretli sonuç)"""
+        xy = _as_xy_array(points)
+        if len(xy) < 3:
+            return 0.0
+        return float(_shoelace(xy))
+
+    @staticmethod
+    def calculate_perimeter(points):
+        """Kapalı polygon çevresi"""
+        xy = _as_xy_array(points)
+        if len(xy) < 2:
+            return 0.0
+        return float(_perimeter(xy))
+
+    @staticmethod
+    def is_points_in_polygon(points, polygon):
+        """Çok sayıda noktayı tek çağrıda poligonla test et (bool dizisi)"""
+        xy = _as_xy_array(points)
+        poly = _as_xy_array(polygon)
+        if len(poly) < 3 or not len(xy):
+            return np.zeros(len(xy), dtype=np.bool_)
+        return _pip_kernel(
+            np.ascontiguousarray(xy[:, 0]),
+            np.ascontiguousarray(xy[:, 1]),
+            poly
+        )
+
+    @staticmethod
+    def is_point_in_polygon(point, polygon):
+        """Tek nokta testi; toplu çekirdeğin ince sarmalayıcısı"""
+        result = GeometryUtils.is_points_in_polygon(
+            np.asarray([point], dtype=np.float64), polygon
+        )
+        return bool(result[0]) if len(result) else False
+
+    @staticmethod
+    def calculate_distance(p1, p2):
+        """İki nokta arası Öklid uzaklığı
+
+        math.hypot tek C çağrısıdır: kare alma ara değerleri ve ** bayt
+        kodu yerine geçer, çok büyük/küçük bileşenlerde taşma yapmaz.
+        """
+        return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
+
+    @staticmethod
+    def pairwise_distances(points):
+        """Tüm nokta çiftleri arası uzaklık matrisi (N, N)
+
+        (P[:,None]-P[None,:]) farkı N*N*2 elemanlık ara dizi kurar; onun
+        yerine kare normlar bir kez indirgenir ve çapraz terim tek P @ P.T
+        (BLAS gemm) çarpımından gelir. Kayan nokta yuvarlaması köşegende
+        küçük negatifler bırakabildiği için sqrt öncesi sıfıra kırpılır;
+        her iki adım da out= ile yerinde çalışır, ek tampon yok.
+        """
+        p = _as_xy_array(points)
+        if not len(p):
+            return np.zeros((0, 0), dtype=np.float64)
+        sq = (p * p).sum(axis=1)
+        d2 = sq[:, None] + sq[None, :] - 2.0 * (p @ p.T)
+        np.maximum(d2, 0.0, out=d2)
+        return np.sqrt(d2, out=d2)
+
+    @staticmethod
+    def calculate_bounding_box(points):
+        """Sınır kutusu (min_x, min_y, max_x, max_y) — iki eksen indirgemesi"""
+        if isinstance(points, Polygon):
+            # SoA hızlı yolu: (N,2) kopyası kurmadan sütun indirgemeleri
+            return points.bounding_box()
+        xy = _as_xy_array(points)
+        if not len(xy):
+            return (0.0, 0.0, 0.0, 0.0)
+        mins = xy.min(axis=0)
+        maxs = xy.max(axis=0)
+        return (float(mins[0]), float(mins[1]), float(maxs[0]), float(maxs[1]))
+
+    @staticmethod
+    def calculate_centroid(points):
+        """Köşe noktalarının ortalaması (x, y) — tek mean indirgemesi"""
+        if isinstance(points, Polygon):
+            return points.centroid()
+        xy = _as_xy_array(points)
+        if not len(xy):
+            return (0.0, 0.0)
+        center = xy.mean(axis=0)
+        return (float(center[0]), float(center[1]))
+
+
+# Birim -> metre çarpanları; MappingProxyType yanlışlıkla yerinde
+# değişikliğe kapalıdır ve güvenle paylaşılabilir
+UNIT_CONVERSIONS = MappingProxyType({
+    'mm': 0.001,
+    'cm': 0.01,
+    'm': 1.0,
+    'km': 1000.0,
+    'inch': 0.0254,
+    'ft': 0.3048
+})
+
+
+@functools.lru_cache(maxsize=64)
+def _ratio(from_unit, to_unit):
+    """(kaynak, hedef) çifti için çarpan; çift başına tek sözlük araması"""
+    return (UNIT_CONVERSIONS.get(from_unit, 1.0)
+            / UNIT_CONVERSIONS.get(to_unit, 1.0))
+
+
+class UnitUtils:
+    """Uzunluk birim dönüşümleri (durumsuz, statik metotlar)"""
+
+    UNIT_CONVERSIONS = UNIT_CONVERSIONS
+
+    @staticmethod
+    def convert_length(value, from_unit, to_unit):
+        """Skaler uzunluk dönüşümü; oran lru_cache'ten gelir"""
+        return value * _ratio(from_unit.lower(), to_unit.lower())
+
+    @staticmethod
+    def convert_length_array(values, from_unit, to_unit):
+        """Uzunluk dizisini tek ufunc çarpımıyla dönüştür
+
+        Eleman başına convert_length döngüsü yerine ölçek bir kez
+        çözülür ve tüm dizi tek SIMD geçişinde çarpılır.
+        """
+        return (np.asarray(values, dtype=np.float64)
+                * _ratio(from_unit.lower(), to_unit.lower()))
+
+
+@functools.lru_cache(maxsize=256)
+def _hex_to_rgb_cached(hex_color):
+    """'#rrggbb' -> (r, g, b); küçük tema paleti için tekrar ayrıştırma yok
+
+    Üç ayrı int(substr, 16) yerine dize bir kez ayrıştırılıp kanallar bit
+    kaydırmayla çıkarılır; '#abc' kısaltması da desteklenir.
+    """
+    s = hex_color.lstrip('#')
+    if len(s) == 3:
+        s = ''.join(c * 2 for c in s)
+    v = int(s, 16)
+    return ((v >> 16) & 0xff, (v >> 8) & 0xff, v & 0xff)
+
+
+class ColorUtils:
+    """Renk dönüşümleri ve palet üretimi (durumsuz, statik metotlar)"""
+
+    @staticmethod
+    def hex_to_rgb(hex_color):
+        """'#rrggbb' -> (r, g, b); lru_cache'li modül fonksiyonuna delege"""
+        return _hex_to_rgb_cached(hex_color)
+
+    @staticmethod
+    def rgb_to_hex(rgb):
+        """(r, g, b) -> '#rrggbb'; üç format işlemi yerine tek bytes.hex()"""
+        return '#' + bytes(rgb).hex()
+
+    @staticmethod
+    def generate_color_palette(base_color, n_colors):
+        """Taban renkten n tonluk palet üret
+
+        Parlaklık çarpanları ve kanal aritmetiği renk başına Python float
+        işlemleri yerine tek broadcast ile hesaplanır; yalnızca hex'e
+        dönüştürme Python'da kalır.
+        """
+        if n_colors <= 0:
+            return []
+
+        base = np.asarray(_hex_to_rgb_cached(base_color), dtype=np.float64)
+        factors = 0.7 + (np.arange(n_colors) % 3) * 0.15
+        rgb = np.clip(base[None, :] * factors[:, None], 0, 255).astype(np.uint8)
+        return ['#' + row.tobytes().hex() for row in rgb]
+
+
+class FileUtils:
+    """Dosya sistemi yardımcıları (durumsuz, statik metotlar)"""
+
+    @staticmethod
+    def get_file_info(file_path):
+        """Dosya bilgisi tek os.stat çağrısıyla
+
+        exists + stat + iki access yerine tek stat; okunabilirlik ve
+        yazılabilirlik mod bitlerinden türetilir (etkin uid, etkin gid ve
+        ek grup üyelikleri; root her zaman erişir), geteuid olmayan
+        platformlarda os.access'e düşülür.
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return {}
+
+        try:
+            euid = os.geteuid()
+            if euid == 0:
+                # root dosya izin bitlerinden bağımsız okur/yazar
+                readable = writable = True
+            else:
+                if st.st_uid == euid:
+                    shift = 6
+                elif (st.st_gid == os.getegid()
+                      or st.st_gid in os.getgroups()):
+                    # Ek grup üyelikleri de grup bitlerini etkinleştirir
+                    shift = 3
+                else:
+                    shift = 0
+                perms = st.st_mode >> shift
+                readable = bool(perms & 4)
+                writable = bool(perms & 2)
+        except (AttributeError, OSError):
+            readable = os.access(file_path, os.R_OK)
+            writable = os.access(file_path, os.W_OK)
+
+        return {
+            'boyut': st.st_size,
+            'boyut_mb': round(st.st_size / (1024 * 1024), 2),
+            'degistirilme': st.st_mtime,
+            'okunabilir': readable,
+            'yazilabilir': writable
+        }
+
+    @staticmethod
+    def validate_file_extension(filename, allowed_extensions):
+        """Uzantı kontrolü Path nesnesi kurmadan: tek rfind + küme üyeliği
+
+        Çağıranın frozenset vermesi hızlı yoldur; dizi verilirse üyelik
+        için bir kez kümeye çevrilir.
+        """
+        i = filename.rfind('.')
+        if i < 0:
+            return False
+        if not isinstance(allowed_extensions, (set, frozenset)):
+            allowed_extensions = frozenset(
+                ext.lower() for ext in allowed_extensions
+            )
+        return filename[i:].lower() in allowed_extensions
+
+class ValidationUtils:
+    """Girdi doğrulama yardımcıları (durumsuz, statik metotlar)"""
+
+    @staticmethod
+    def validate_coordinates(coords):
+        """Koordinat dizisi geçerli mi: (N,2) sayısal ve tamamı sonlu
+
+        Eleman başına isinstance/isnan döngüsü yerine tek dtype dönüşümü
+        ve tek np.isfinite indirgemesi; sayısal olmayan girdiler dönüşümde
+        TypeError/ValueError fırlatır ve False'a düşer.
+        """
+        try:
+            arr = np.asarray(coords, dtype=np.float64)
+        except (TypeError, ValueError):
+            return False
+        return (arr.ndim == 2 and arr.shape[1] == 2 and arr.shape[0] > 0
+                and bool(np.isfinite(arr).all()))
+
+
+def _clean_finite(data):
+    """Girdiyi düz float64 dizisine çevirip sonlu olmayanları ele
+
+    Üç istatistik girişi de aynı filtreye ihtiyaç duyar; tek np.isfinite
+    geçişi + boolean indeksleme, eleman başına isnan/isinf kontrolü yapan
+    yorumlayıcı döngüsünün yerini alır. Zaten tamamen sonlu dizilerde
+    kopya çıkmaz.
+    """
+    values = np.ascontiguousarray(data, dtype=np.float64).ravel()
+    if values.size:
+        finite = np.isfinite(values)
+        if not finite.all():
+            values = values[finite]
+    return values
+
+
+class StatisticsUtils:
+    """Sayısal dizi istatistikleri (durumsuz, statik metotlar)"""
+
+    @staticmethod
+    def calculate_statistics(data):
+        """Temel istatistikler: ortalama/std/medyan/min/max/toplam
+
+        Liste de kabul edilir ama kopyasız yol ndarray iledir; sonlu
+        olmayan değerler tek isfinite maskesiyle elenir, ortalama,
+        standart sapma, min ve max tek füzyonlu geçişte indirgenir,
+        medyan için ayrı bir seçim geçişi gerekir (np.median).
+        """
+        values = _clean_finite(data)
+        if values.size == 0:
+            return {'ortalama': 0.0, 'std': 0.0, 'medyan': 0.0,
+                    'min': 0.0, 'max': 0.0, 'toplam': 0.0}
+
+        if values.size > PARALLEL_STATS_THRESHOLD:
+            total, sq_total, mn, mx = _basic_stats_par(values)
+        else:
+            total, sq_total, mn, mx = _basic_stats(values)
+        mean = total / values.size
+        variance = max(sq_total / values.size - mean * mean, 0.0)
+        return {
+            'ortalama': float(mean),
+            'std': float(math.sqrt(variance)),
+            'medyan': float(np.median(values)),
+            'min': float(mn),
+            'max': float(mx),
+            'toplam': float(total)
+        }
+
+    @staticmethod
+    def calculate_percentiles(data, percentiles=(25, 50, 75, 90, 95)):
+        """İstenen yüzdelikleri tek np.quantile çağrısıyla hesapla
+
+        Yüzdelik başına ayrı np.percentile çağrısı diziyi her seferinde
+        yeniden sıralar; hepsi tek çağrıda tek sıralamayla çıkar.
+        """
+        values = _clean_finite(data)
+        if values.size == 0:
+            return {f'p{p}': 0.0 for p in percentiles}
+
+        qs = np.asarray(percentiles, dtype=np.float64) / 100.0
+        results = np.quantile(values, qs)
+        return {f'p{p}': float(v) for p, v in zip(percentiles, results)}
+
+    @staticmethod
+    def detect_outliers(data, method='iqr'):
+        """Aykırı değer indekslerini döndür ('iqr' veya 'zscore')
+
+        İndeks toplama Python döngüsü yerine tek vektörel karşılaştırma +
+        np.flatnonzero ile yapılır; IQR sınırları tek quantile çağrısından
+        (tek sıralama) gelir.
+        """
+        values = _clean_finite(data)
+        if values.size == 0:
+            return []
+
+        if method == 'zscore':
+            std = values.std()
+            if std == 0:
+                return []
+            mask = np.abs(values - values.mean()) > 3 * std
+        else:
+            q1, q3 = np.quantile(values, (0.25, 0.75))
+            iqr = q3 - q1
+            mask = (values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)
+
+        return np.flatnonzero(mask).tolist()